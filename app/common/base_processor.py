@@ -1,9 +1,15 @@
 from abc import ABC, abstractmethod
 from jsonschema import validate, ValidationError
-import dateutil.parser
+import copy
 import fnmatch
+import functools
 import re
 import json
+import os
+import sys
+import warnings
+import numpy as np
+import pandas as pd
 import yaml
 
 DEFAULT_HEADERS = {
@@ -14,6 +20,224 @@ DEFAULT_HEADERS = {
   "deposit": "Amount",
 }
 
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Validated rules keyed by the absolute path, modification time and size of both
+# the rules file and the schema file, holding at most RULES_CACHE_SIZE entries
+RULES_CACHE: dict = {}
+RULES_CACHE_SIZE = 32
+
+# Date formats parsed column-wise before falling back to format inference
+DATE_FORMATS = ("%Y-%m-%d", "%m-%d-%Y")
+
+NON_ALPHANUMERIC = re.compile(r"[^a-zA-Z0-9 ]+")
+
+
+def format_line(
+  date: str, description: str, debit_line: str, amount: str, credit_line: str
+) -> str:
+  """Format a single ledger entry.
+
+  Args:
+    date (str): The formatted transaction date.
+    description (str): The cleaned transaction description.
+    debit_line (str): The padded debit account line of the rule, see rule_columns.
+    amount (str): The amount, including any prefix.
+    credit_line (str): The credit account line of the rule, see rule_columns.
+
+  Returns:
+    str: The ledger entry spanning three lines.
+  """
+  return f"{date} {description}{debit_line}{amount}{credit_line}"
+
+
+def parse_dates(dates: any) -> any:
+  """Parse a Series of date strings, trying the common fixed formats first.
+
+  Each format in DATE_FORMATS is parsed in a single vectorized call over the
+  dates still unparsed. Only the remaining dates fall back to per-element
+  format inference, and dates whose time zones cannot share a column keep their
+  wall time. A Series that already holds datetimes, naive or time zone aware, is
+  returned as is.
+
+  Args:
+    dates (any): The Series of date strings, or of datetimes.
+
+  Returns:
+    any: The Series of parsed dates.
+
+  Raises:
+    ValueError: If a date cannot be parsed.
+    TypeError: If a date is missing.
+  """
+  if pd.api.types.is_datetime64_any_dtype(dates):
+    parsed = dates
+  else:
+    parsed = pd.to_datetime(dates, format=DATE_FORMATS[0], errors="coerce", cache=True)
+    for date_format in (*DATE_FORMATS[1:], "mixed"):
+      fallback = parsed.isna().to_numpy()
+      if not fallback.any():
+        break
+      if fallback.all():
+        # Parse the whole column, which keeps the time zone of aware dates
+        parsed = parse_date_format(dates, date_format)
+        continue
+      parsed_fallback = parse_date_format(dates[fallback], date_format)
+      if parsed_fallback.dt.tz is not None:
+        # Aware dates cannot share a column with naive ones, so keep their wall
+        # time, which is what gets formatted
+        parsed_fallback = parsed_fallback.dt.tz_localize(None)
+      values = parsed.to_numpy()
+      values[fallback] = parsed_fallback.to_numpy()
+      parsed = pd.Series(values, index=dates.index, name=dates.name)
+  # Missing dates are left as NaT by every format, including "mixed"
+  if parsed.isna().any():
+    raise TypeError("Every transaction must have a date")
+  return parsed
+
+
+def parse_date_format(dates: any, date_format: str) -> any:
+  """Parse a Series of date strings in a single format.
+
+  Dates that do not match a fixed format become NaT, while the "mixed" format
+  raises on them. Dates with differing UTC offsets, such as those either side of
+  a daylight saving change, or aware dates among naive ones cannot share a
+  datetime64 column, so each of them keeps its wall time instead.
+
+  Args:
+    dates (any): The Series of date strings.
+    date_format (str): The format to parse, or "mixed" to infer it per date.
+
+  Returns:
+    any: The Series of parsed dates.
+
+  Raises:
+    ValueError: If a date cannot be parsed in the "mixed" format.
+  """
+  with warnings.catch_warnings():
+    # Mixed time zones are handled below, by keeping each date's wall time
+    warnings.filterwarnings("ignore", "(?s).*mixed time zones", FutureWarning)
+    parsed = pd.to_datetime(
+      dates,
+      format=date_format,
+      errors="raise" if date_format == "mixed" else "coerce",
+      cache=True,
+    )
+  if not pd.api.types.is_datetime64_any_dtype(parsed):
+    parsed = pd.to_datetime(
+      parsed.map(lambda date: date.replace(tzinfo=None), na_action="ignore")
+    )
+  return parsed
+
+
+def parse_amounts(amounts: any) -> any:
+  """Parse a Series of amounts into a float64 array.
+
+  Numeric columns, such as those produced by normalize_transactions, are used as
+  they are. Otherwise commas are removed from the amount strings column-wise
+  before converting them to float.
+
+  Args:
+    amounts (any): The Series of amounts.
+
+  Returns:
+    any: The amounts as a float64 array.
+  """
+  if pd.api.types.is_numeric_dtype(amounts):
+    return amounts.to_numpy(dtype="float64")
+  return (
+    amounts.astype(str).str.replace(",", "", regex=False).to_numpy().astype("float64")
+  )
+
+
+def rule_columns(rules: list) -> dict:
+  """Convert a list of rules into parallel arrays, one per rule field.
+
+  Args:
+    rules (list): The list of rules to convert.
+
+  Returns:
+    dict: Arrays of the debit lines, credit lines and descriptions of the rules,
+      indexed by rule position. Rules without a description hold None. The
+      debit and credit lines are the constant parts of each rule's ledger entry,
+      with the debit account already padded, so that format_line only has to
+      fill in the date, description and amount.
+  """
+  return {
+    "debit_line": np.array(
+      [f"\n\t{rule['debit_account']:<50}" for rule in rules], dtype=object
+    ),
+    "credit_line": np.array(
+      [f"\n\t{rule['credit_account']}" for rule in rules], dtype=object
+    ),
+    "description": np.array([rule.get("description") for rule in rules], dtype=object),
+  }
+
+
+@functools.lru_cache(maxsize=8)
+def compile_transaction_types(transaction_types: tuple) -> re.Pattern:
+  """Compile the transaction type globs of a list of rules into a single pattern.
+
+  Each rule becomes a named group `rule_<index>`. Every alternative may start
+  anywhere in the description and the alternatives are tried in rule order, so
+  the first rule that matches wins, as in match_rule. Patterns are cached by
+  content.
+
+  Args:
+    transaction_types (tuple): The transaction type globs, in rule order.
+
+  Returns:
+    re.Pattern: A pattern to match against lower-cased descriptions.
+  """
+  if not transaction_types:
+    return re.compile(r"(?!)")
+  # Leading wildcards are redundant after the lazy prefix, and dropping them
+  # avoids two unbounded repeats in a row, which backtrack quadratically on long
+  # descriptions that do not match
+  return re.compile(
+    "|".join(
+      f"(?s:.*?)(?P<rule_{index}>{fnmatch.translate(transaction_type.lower().lstrip('*'))})"
+      for index, transaction_type in enumerate(transaction_types)
+    )
+  )
+
+
+def first_rule_id(pattern: re.Pattern, description: str) -> int:
+  """Return the index of the first rule of a compiled pattern matching a description.
+
+  Args:
+    pattern (re.Pattern): The pattern compiled by compile_transaction_types.
+    description (str): The lower-cased description.
+
+  Returns:
+    int: The index of the matching rule, or -1 if no rule matches.
+  """
+  match = pattern.match(description)
+  return int(match.lastgroup[len("rule_") :]) if match else -1
+
+
+@functools.lru_cache(maxsize=8)
+def literal_rule_ids(transaction_types: tuple) -> dict:
+  """Map descriptions that equal a wildcard-free transaction type to their rule.
+
+  A description equal to a literal transaction type needs no regex search: its
+  first matching rule, which may be an earlier wildcard rule, is resolved once
+  here and then found with a dict lookup.
+
+  Args:
+    transaction_types (tuple): The transaction type globs, in rule order.
+
+  Returns:
+    dict: The index of the first matching rule, keyed by lower-cased description.
+  """
+  pattern = compile_transaction_types(transaction_types)
+  return {
+    literal: first_rule_id(pattern, literal)
+    for literal in (transaction_type.lower() for transaction_type in transaction_types)
+    if not any(char in literal for char in "*?[")
+  }
+
 
 class BaseProcessor(ABC):
   """Abstract Base Class for processing financial transaction data."""
@@ -51,6 +275,9 @@ class BaseProcessor(ABC):
   def load_rules(self, file_path: str, schema_path: str = "schema.json") -> dict:
     """Load validation rules from a YAML file and validate against a JSON schema.
 
+    Rules are cached until the rules file or the schema file is modified, and
+    each call returns its own copy of the cached rules.
+
     Args:
       file_path (str): Path to the rules file in YAML format.
       schema_path (str): Path to the JSON schema file for validation.
@@ -59,36 +286,89 @@ class BaseProcessor(ABC):
       dict: The validated rules.
 
     Raises:
+      FileNotFoundError: If the rules file or the schema file does not exist.
       ValidationError: If the rules do not conform to the schema.
     """
-    with open(file_path, "r") as file:
-      rules = yaml.safe_load(file)
-      file.close()
+    rules_stat = os.stat(file_path)
+    schema_stat = os.stat(schema_path)
+    key = (
+      os.path.abspath(file_path),
+      rules_stat.st_mtime_ns,
+      rules_stat.st_size,
+      os.path.abspath(schema_path),
+      schema_stat.st_mtime_ns,
+      schema_stat.st_size,
+    )
+    if key not in RULES_CACHE:
+      with open(file_path, "r") as file:
+        rules = self.load_rules_from_stream(file, schema_path)
+      if len(RULES_CACHE) >= RULES_CACHE_SIZE:
+        RULES_CACHE.pop(next(iter(RULES_CACHE)))
+      RULES_CACHE[key] = rules
+    return copy.deepcopy(RULES_CACHE[key])
+
+  def load_rules_from_stream(self, stream, schema_path: str = "schema.json") -> dict:
+    """Load validation rules from a YAML stream and validate against a JSON schema.
+
+    Args:
+      stream (TextIO): An open text stream, or string, containing the rules in YAML format.
+      schema_path (str): Path to the JSON schema file for validation.
+
+    Returns:
+      dict: The validated rules.
+
+    Raises:
+      ValidationError: If the rules do not conform to the schema.
+    """
+    rules = yaml.load(stream, Loader=YAML_LOADER)
     with open(schema_path, "r") as sf:
       schema = json.load(sf)
-      sf.close()
     errors = validate(rules, schema)
     if errors:
       raise ValidationError(f"Validation Errors: {errors}")
+    self.intern_accounts(rules)
+    return rules
+
+  def intern_accounts(self, rules: dict) -> dict:
+    """Intern the debit and credit account names of every rule in place.
+
+    Account names repeat on nearly every output line, so interning them lets
+    identical accounts share one string object and compare by identity.
+
+    Args:
+      rules (dict): The validated rules.
+
+    Returns:
+      dict: The same rules, with interned account names.
+    """
+    for rule_type in ("income", "expense"):
+      for rule in rules["rules"][rule_type]:
+        rule["debit_account"] = sys.intern(rule["debit_account"])
+        rule["credit_account"] = sys.intern(rule["credit_account"])
     return rules
 
   def sort_transactions(self, transactions_df: any, headers: dict) -> any:
     """Sort transactions by date in ascending order.
 
+    Transactions with identical dates keep their input order.
+
     Args:
       transactions_df (any): The DataFrame containing transaction data.
       headers (dict): The headers mapping for the DataFrame.
 
     Returns:
       any: The DataFrame sorted by date.
+
+    Raises:
+      ValueError: If a date cannot be parsed.
+      TypeError: If a date is missing.
     """
-    transactions_df["sort"] = transactions_df[headers["date"]].apply(
-      dateutil.parser.parse
-    )
-    transactions_df = transactions_df.sort_values(by="sort")
-    return transactions_df
+    dates = parse_dates(transactions_df[headers["date"]])
+    order = dates.argsort(kind="stable").to_numpy()
+    return transactions_df.take(order)
 
-  def normalize_transactions(self, transactions_df: any, headers: dict) -> any:
+  @staticmethod
+  def normalize_transactions(transactions_df: any, headers: dict) -> any:
     """Normalize transactions for income and expense.
 
     Args:
@@ -112,7 +392,8 @@ class BaseProcessor(ABC):
     )
     return transactions_df
 
-  def transform_transactions(self, transactions_df: any, rules: dict, headers: dict):
+  @classmethod
+  def transform_transactions(cls, transactions_df: any, rules: dict, headers: dict):
     """Transform transactions based on specified rules and headers.
 
     Args:
@@ -122,6 +403,10 @@ class BaseProcessor(ABC):
 
     Returns:
       list: A list of transformed transaction strings ready for output.
+
+    Raises:
+      ValueError: If a date cannot be parsed.
+      TypeError: If a date is missing.
     """
     income_rules = rules["rules"]["income"]
     expense_rules = rules["rules"]["expense"]
@@ -129,33 +414,96 @@ class BaseProcessor(ABC):
       rules.get("output", {}).get("amount", {}).get("prefix", "$")
     )  # Default to '$' if not defined
 
-    output = []
-    for _, row in transactions_df.iterrows():
-      date = dateutil.parser.parse(row[headers["date"]])
-      formatted_date = date.strftime("%Y/%m/%d")
-      description = row[headers["description"]]
-      amount_str = str(row[headers["amount"]])
-      # Remove commas from the amount string and convert to float
-      amount = float(amount_str.replace(",", ""))
-      applicable_rules = income_rules if amount > 0 else expense_rules
-      amount = abs(amount)
-      rule = self.match_rule(description, applicable_rules)
-      if rule:
-        debit_account = rule["debit_account"]
-        credit_account = rule["credit_account"]
-        output_description = (
-          re.sub(r"[^a-zA-Z0-9 ]+", " ", rule.get("description", description))
-          .title()
-          .replace("\n", " ")
-        )
-        output.append(
-          f"{formatted_date} {output_description}\n\t{debit_account:<50}{amount_prefix}{amount}\n\t{credit_account}"
-        )
-    return output
+    # Parse the date and amount columns once, instead of once per row
+    dates = parse_dates(transactions_df[headers["date"]]).dt.strftime("%Y/%m/%d")
+    dates = dates.to_numpy()
+    descriptions = transactions_df[headers["description"]]
+    amounts = parse_amounts(transactions_df[headers["amount"]])
+    # Income and expense rules share one set of columns, so expense rule ids
+    # are offset by the number of income rules
+    is_income = amounts > 0
+    expense_ids = cls.match_rules(descriptions[~is_income], expense_rules)
+    rule_ids = np.full(len(transactions_df), -1)
+    rule_ids[is_income] = cls.match_rules(descriptions[is_income], income_rules)
+    rule_ids[~is_income] = np.where(
+      expense_ids < 0, -1, expense_ids + len(income_rules)
+    )
+    columns = rule_columns(income_rules + expense_rules)
+
+    matched = rule_ids >= 0
+    rule_ids = rule_ids[matched]
+    # Rules may override the description, then all descriptions are cleaned and
+    # title-cased column-wise
+    rule_descriptions = columns["description"].take(rule_ids)
+    output_descriptions = (
+      pd.Series(
+        np.where(
+          pd.isna(rule_descriptions),
+          descriptions.to_numpy()[matched],
+          rule_descriptions,
+        ),
+        dtype=object,
+      )
+      .str.replace(NON_ALPHANUMERIC, " ", regex=True)
+      .str.title()
+      .str.replace("\n", " ", regex=False)
+    )
+
+    amounts = [
+      f"{amount_prefix}{amount}" for amount in np.abs(amounts[matched]).tolist()
+    ]
+    return list(
+      map(
+        format_line,
+        dates[matched],
+        output_descriptions.to_numpy(),
+        columns["debit_line"].take(rule_ids),
+        amounts,
+        columns["credit_line"].take(rule_ids),
+      )
+    )
+
+  @staticmethod
+  def match_rules(descriptions: any, rules: list) -> any:
+    """Match each description against a list of rules in a single pass.
+
+    Args:
+      descriptions (any): The Series of transaction descriptions. Repeated
+        descriptions are matched once, and missing descriptions never match.
+      rules (list): The list of rules against which to match the descriptions.
+
+    Returns:
+      any: An array holding the index of the first matching rule for each
+        description, or -1 if no rule matches.
+    """
+    if isinstance(descriptions.dtype, pd.CategoricalDtype):
+      # Categories are already distinct, so skip straight to gathering by code
+      codes = descriptions.cat.codes.to_numpy()
+      descriptions = descriptions.cat.categories.to_series().str.lower()
+    else:
+      # Match each distinct description once; missing values get code -1
+      codes, uniques = pd.factorize(descriptions.str.lower())
+      descriptions = pd.Series(uniques, dtype=object)
+    transaction_types = tuple(rule["transaction_type"] for rule in rules)
+    pattern = compile_transaction_types(transaction_types)
+    # Resolve descriptions equal to a literal rule with a dict lookup first, and
+    # only search the compiled pattern for the rest
+    rule_ids = descriptions.map(literal_rule_ids(transaction_types)).to_numpy(
+      dtype=float, na_value=np.nan
+    )
+    unresolved = np.isnan(rule_ids)
+    rule_ids[unresolved] = descriptions[unresolved].map(
+      functools.partial(first_rule_id, pattern)
+    )
+    # Code -1 picks the appended "no match"
+    return np.append(rule_ids.astype(int), -1)[codes]
 
   def match_rule(self, transaction_type, rules):
     """Match a transaction type against defined rules to find applicable processing rule.
 
+    This is the one-description-at-a-time reference for match_rules, which must
+    agree with it on every glob.
+
     Args:
       transaction_type (str): The description of the transaction type.
       rules (list): The list of rules against which to match the transaction type.
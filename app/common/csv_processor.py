@@ -1,24 +1,40 @@
 from abc import ABC
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterator
 from common.base_processor import BaseProcessor, DEFAULT_HEADERS
+import os
 import pandas as pd
 
+# Parser used by load_input_file. Set PYLEDGER_CSV_ENGINE=pyarrow to use the
+# multithreaded pyarrow parser, which requires the pyarrow package. It rejects
+# files whose rows have fewer fields than the header, such as exports with a
+# trailing comma in the header only.
+CSV_ENGINE = os.environ.get("PYLEDGER_CSV_ENGINE", "c")
+
+# Files larger than this are memory-mapped by the C parser instead of read
+MEMORY_MAP_THRESHOLD = 8 * 1024 * 1024
+
 
 class CsvProcessor(BaseProcessor, ABC):
-  def __init__(self, rules_file_path: Path, input_file_path: Path):
+  def __init__(self, rules_file_path: Path, input_file_path: Path = None):
     """
     Initializes the CsvProcessor instance.
 
     Args:
       rules_file_path (Path): The file path to the rules file to determine how to process the CSV.
       input_file_path (Path): The file path to the input CSV file containing transactions.
+        Defaults to None, which leaves transactions unloaded for transform_stream.
 
     This constructor loads the rules from the provided rules file, retrieves the headers
     based on those rules, and loads the input CSV file into a DataFrame.
     """
     self.rules = self.load_rules(rules_file_path)
     self.headers = self.get_header(self.rules)
-    self.transactions = self.load_input_file(input_file_path)
+    self.transactions = (
+      None if input_file_path is None else self.load_input_file(input_file_path)
+    )
 
   def load_input_file(self, file_path: Path) -> pd.DataFrame:
     """
@@ -30,12 +46,89 @@ class CsvProcessor(BaseProcessor, ABC):
     Returns:
       pd.DataFrame: A DataFrame containing the data from the CSV file.
     """
+    # Only local files can be checked up front. Buffers and URLs go straight to
+    # read_csv and are never memory-mapped.
+    file_size = 0
+    if isinstance(file_path, (str, os.PathLike)) and os.path.isfile(file_path):
+      file_size = os.path.getsize(file_path)
+      if file_size == 0:
+        raise pd.errors.EmptyDataError
     try:
-      ret = pd.read_csv(file_path)
+      ret = pd.read_csv(
+        file_path,
+        engine=CSV_ENGINE,
+        memory_map=CSV_ENGINE == "c" and file_size > MEMORY_MAP_THRESHOLD,
+      )
     except pd.errors.EmptyDataError:
       raise pd.errors.EmptyDataError
     return ret
 
+  def transform_stream(
+    self,
+    file_path: Path,
+    rules: dict = None,
+    headers: dict = None,
+    chunksize: int = 100_000,
+    workers: int = 1,
+  ) -> Iterator[str]:
+    """
+    Transforms the input CSV file chunk by chunk, without loading it whole.
+
+    Args:
+      file_path (Path): The file path of the input CSV file.
+      rules (dict): The rules to apply. Defaults to the rules of this processor.
+      headers (dict): The headers mapping. Defaults to the headers of this processor.
+      chunksize (int): The number of rows to read and transform at a time.
+      workers (int): The number of processes transforming chunks in parallel.
+
+    Yields:
+      str: The transformed transaction strings, in file order.
+
+    Unlike the sort, normalize and transform pipeline in ledger.py, transactions
+    are not sorted by date across chunks, so peak memory is bounded by the chunk
+    size rather than the file size, provided the processor was created without
+    an input file. With more than one worker, at most `workers` chunks are in
+    flight at a time.
+    """
+    rules = self.rules if rules is None else rules
+    headers = self.headers if headers is None else headers
+    # Keep amounts as text so that every chunk parses the same way, whether or
+    # not its amounts contain thousands separators
+    dtype = {headers["amount"]: str} if "amount" in headers else None
+    with pd.read_csv(file_path, chunksize=chunksize, dtype=dtype) as reader:
+      if workers <= 1:
+        for chunk in reader:
+          yield from self.transform_chunk(chunk, rules, headers)
+        return
+      with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in reader:
+          pending.append(pool.submit(self.transform_chunk, chunk, rules, headers))
+          if len(pending) >= workers:
+            yield from pending.popleft().result()
+        while pending:
+          yield from pending.popleft().result()
+
+  @classmethod
+  def transform_chunk(cls, chunk: pd.DataFrame, rules: dict, headers: dict) -> list:
+    """
+    Normalizes and transforms a single chunk of transactions.
+
+    Args:
+      chunk (pd.DataFrame): The chunk of transactions read from the CSV file.
+      rules (dict): The rules to apply.
+      headers (dict): The headers mapping.
+
+    Returns:
+      list: The transformed transaction strings of the chunk.
+
+    This is a class method so that submitting it to a worker process pickles only
+    the chunk, rules and headers, and not a processor holding loaded transactions.
+    The normalize and transform steps take everything they need as arguments.
+    """
+    chunk = cls.normalize_transactions(chunk, headers)
+    return cls.transform_transactions(chunk, rules, headers)
+
   def get_header(self, rules) -> dict:
     """
     Retrieves the headers for the CSV based on the provided rules.
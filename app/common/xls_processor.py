@@ -1,8 +1,14 @@
 from abc import ABC
 from pathlib import Path
 from common.base_processor import BaseProcessor, DEFAULT_HEADERS
+import os
 import pandas as pd
 
+# Reader used by load_input_file. Set PYLEDGER_EXCEL_ENGINE=calamine to use the
+# Rust-backed reader, which requires the python-calamine package. By default
+# pandas picks the reader from the file extension.
+EXCEL_ENGINE = os.environ.get("PYLEDGER_EXCEL_ENGINE") or None
+
 
 class XlsProcessor(BaseProcessor, ABC):
   """
@@ -61,7 +67,7 @@ class XlsProcessor(BaseProcessor, ABC):
       Exception: If there is an error loading the Excel file.
     """
     try:
-      df = pd.read_excel(file_path, skiprows=self.first_row - 1)
+      df = pd.read_excel(file_path, skiprows=self.first_row - 1, engine=EXCEL_ENGINE)
       return df
     except Exception:
       raise
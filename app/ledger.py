@@ -6,11 +6,20 @@ from common.xls_processor import XlsProcessor
 app = typer.Typer()
 
 
-@app.command()
-def main(
-  input_file: Path = typer.Argument(..., help="Path to the input CSV or XLSX file"),
-  rules_file: Path = typer.Argument(..., help="Path to the rules YAML file"),
-):
+def run_ledger(input_file: Path, rules_file: Path) -> tuple:
+  """Transform an input file into ledger entries according to a rules file.
+
+  Args:
+    input_file (Path): Path to the input CSV or XLS file.
+    rules_file (Path): Path to the rules YAML file.
+
+  Returns:
+    tuple: The ledger entries joined into a single string, and the output path
+      from the rules, or None if the rules do not define one.
+
+  Raises:
+    ValueError: If the input file format is not supported.
+  """
   if input_file.suffix == ".csv":
     processor = CsvProcessor(rules_file, input_file)
   elif input_file.suffix == ".xls":
@@ -25,13 +34,21 @@ def main(
   transactions_df = processor.normalize_transactions(transactions_df, headers)
   output = processor.transform_transactions(transactions_df, rules, headers)
 
-  output_path = rules.get("output", {}).get("path")
+  return "\n".join(output), rules.get("output", {}).get("path")
+
+
+@app.command()
+def main(
+  input_file: Path = typer.Argument(..., help="Path to the input CSV or XLSX file"),
+  rules_file: Path = typer.Argument(..., help="Path to the rules YAML file"),
+):
+  ledger, output_path = run_ledger(input_file, rules_file)
   if output_path:
     with open(output_path, "w") as file:
-      file.write("\n".join(output))
+      file.write(ledger)
     typer.echo(f"Output has been saved to {output_path}")
   else:
-    typer.echo("\n".join(output))
+    typer.echo(ledger)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
-import os
+import io
 import pytest
-import tempfile
 import yaml
+from pathlib import Path
 from jsonschema import ValidationError
 
 # Valid and invalid YAML strings for testing
@@ -32,27 +32,17 @@ fabrication = """
 
 
 def test_load_rules_valid_file(base_processor):
-  with tempfile.NamedTemporaryFile(delete=False, suffix=".yaml") as temp_file:
-    temp_file.write(valid_yaml.encode())
-    temp_file.close()
-
-    result = base_processor.load_rules(temp_file.name)
-    os.remove(temp_file.name)
-    assert "rules" in result
+  result = base_processor.load_rules_from_stream(io.StringIO(valid_yaml))
+  assert "rules" in result
 
 
 def test_load_rules_invalid_yaml(base_processor):
-  with tempfile.NamedTemporaryFile(delete=False, suffix=".yaml") as temp_file:
-    temp_file.write(invalid_yaml.encode())
-    temp_file.close()
-
-    with pytest.raises(yaml.YAMLError):
-      base_processor.load_rules(temp_file.name)
-    os.remove(temp_file.name)
+  with pytest.raises(yaml.YAMLError):
+    base_processor.load_rules_from_stream(io.StringIO(invalid_yaml))
 
 
 def test_load_rules_validation_failure(base_processor):
-  # Create a rules file that is invalid according to schema
+  # Create a rules stream that is invalid according to schema
   wrong_schema_yaml = """
   rules:
     income:
@@ -64,13 +54,8 @@ def test_load_rules_validation_failure(base_processor):
         debit_account: "Expenses"
         credit_account: "Cash"
   """
-  with tempfile.NamedTemporaryFile(delete=False, suffix=".yaml") as temp_file:
-    temp_file.write(wrong_schema_yaml.encode())
-    temp_file.close()
-
   with pytest.raises(ValidationError):
-    base_processor.load_rules(temp_file.name)
-  os.remove(temp_file.name)
+    base_processor.load_rules_from_stream(io.StringIO(wrong_schema_yaml))
 
 
 def test_load_rules_non_existent_file(base_processor):
@@ -79,10 +64,56 @@ def test_load_rules_non_existent_file(base_processor):
 
 
 def test_load_rules_empty_file(base_processor):
-  with tempfile.NamedTemporaryFile(delete=False, suffix=".yaml") as temp_file:
-    temp_file.write(b"")
-    temp_file.close()
+  with pytest.raises(ValidationError):
+    base_processor.load_rules_from_stream(io.StringIO(""))
+
+
+def test_load_rules_interns_accounts(base_processor):
+  result = base_processor.load_rules_from_stream(io.StringIO(valid_yaml))
+  income_rule = result["rules"]["income"][0]
+  expense_rule = result["rules"]["expense"][0]
+  assert income_rule["debit_account"] is expense_rule["credit_account"]
+
+
+def test_load_rules_cached_until_modified(base_processor, tmp_path, monkeypatch):
+  rules_file = tmp_path / "rules.yaml"
+  rules_file.write_text(valid_yaml)
+  parses = []
+  load_rules_from_stream = base_processor.load_rules_from_stream
+  monkeypatch.setattr(
+    base_processor,
+    "load_rules_from_stream",
+    lambda *args: parses.append(args) or load_rules_from_stream(*args),
+  )
+
+  first = base_processor.load_rules(rules_file)
+  second = base_processor.load_rules(rules_file)
+  assert len(parses) == 1
+  rules_file.write_text(valid_yaml.replace("Salary", "Wages"))
+  third = base_processor.load_rules(rules_file)
+
+  assert len(parses) == 2
+  assert first == second
+  assert first is not second
+  assert third["rules"]["income"][0]["transaction_type"] == "Wages"
+
+
+def test_load_rules_cached_until_schema_modified(base_processor, tmp_path, monkeypatch):
+  rules_file = tmp_path / "rules.yaml"
+  rules_file.write_text(valid_yaml)
+  schema_file = tmp_path / "schema.json"
+  schema_file.write_text(Path("schema.json").read_text())
+  parses = []
+  load_rules_from_stream = base_processor.load_rules_from_stream
+  monkeypatch.setattr(
+    base_processor,
+    "load_rules_from_stream",
+    lambda *args: parses.append(args) or load_rules_from_stream(*args),
+  )
+
+  base_processor.load_rules(rules_file, schema_file)
+  base_processor.load_rules(rules_file, schema_file)
+  schema_file.write_text(schema_file.read_text() + "\n")
+  base_processor.load_rules(rules_file, schema_file)
 
-    with pytest.raises(ValidationError):
-      base_processor.load_rules(temp_file.name)
-    os.remove(temp_file.name)
+  assert len(parses) == 2
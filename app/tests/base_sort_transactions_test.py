@@ -75,3 +75,112 @@ def test_sort_transactions_empty_dataframe(base_processor):
   sorted_transactions = base_processor.sort_transactions(transactions, headers)
 
   assert sorted_transactions.empty  # The result should also be an empty DataFrame
+
+
+def test_sort_transactions_parsed_dates(base_processor):
+  transactions = pd.DataFrame(
+    {
+      "Date": pd.to_datetime(["2023-02-01", "2023-01-01", "2023-01-15"]),
+      "Description": ["Transaction 1", "Transaction 2", "Transaction 3"],
+      "Amount": [100, 200, 150],
+    }
+  )
+  headers = base_processor.get_header({})
+
+  sorted_transactions = base_processor.sort_transactions(transactions, headers)
+
+  assert sorted_transactions["Description"].values.tolist() == [
+    "Transaction 2",
+    "Transaction 3",
+    "Transaction 1",
+  ]
+
+
+def test_sort_transactions_dates_with_offsets(base_processor):
+  transactions = pd.DataFrame(
+    {
+      "Date": [
+        "2023-02-01T00:00:00+02:00",
+        "2023-01-01T00:00:00+02:00",
+        "2023-01-15T00:00:00+02:00",
+      ],
+      "Description": ["Transaction 1", "Transaction 2", "Transaction 3"],
+      "Amount": [100, 200, 150],
+    }
+  )
+  headers = base_processor.get_header({})
+
+  sorted_transactions = base_processor.sort_transactions(transactions, headers)
+
+  assert sorted_transactions["Description"].values.tolist() == [
+    "Transaction 2",
+    "Transaction 3",
+    "Transaction 1",
+  ]
+
+
+def test_sort_transactions_parsed_dates_with_time_zone(base_processor):
+  transactions = pd.DataFrame(
+    {
+      "Date": pd.to_datetime(["2023-02-01", "2023-01-01", "2023-01-15"]).tz_localize(
+        "Australia/Sydney"
+      ),
+      "Description": ["Transaction 1", "Transaction 2", "Transaction 3"],
+      "Amount": [100, 200, 150],
+    }
+  )
+  headers = base_processor.get_header({})
+
+  sorted_transactions = base_processor.sort_transactions(transactions, headers)
+
+  assert sorted_transactions["Description"].values.tolist() == [
+    "Transaction 2",
+    "Transaction 3",
+    "Transaction 1",
+  ]
+
+
+def test_sort_transactions_dates_with_several_offsets(base_processor):
+  transactions = pd.DataFrame(
+    {
+      "Date": [
+        "2023-02-01",
+        "2023-01-01T00:00:00+11:00",
+        "2023-01-15T00:00:00+10:00",
+      ],
+      "Description": ["Transaction 1", "Transaction 2", "Transaction 3"],
+      "Amount": [100, 200, 150],
+    }
+  )
+  headers = base_processor.get_header({})
+
+  sorted_transactions = base_processor.sort_transactions(transactions, headers)
+
+  assert sorted_transactions["Description"].values.tolist() == [
+    "Transaction 2",
+    "Transaction 3",
+    "Transaction 1",
+  ]
+
+
+def test_sort_transactions_dates_across_daylight_saving(base_processor):
+  transactions = pd.DataFrame(
+    {
+      "Date": [
+        "2024-04-08T09:00:00+10:00",
+        "2024-03-30T09:00:00+11:00",
+        "2024-04-01T09:00:00+10:00",
+      ],
+      "Description": ["Transaction 1", "Transaction 2", "Transaction 3"],
+      "Amount": [100, 200, 150],
+    }
+  )
+  headers = base_processor.get_header({})
+
+  sorted_transactions = base_processor.sort_transactions(transactions, headers)
+
+  assert sorted_transactions["Description"].values.tolist() == [
+    "Transaction 2",
+    "Transaction 3",
+    "Transaction 1",
+  ]
@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 
 def test_transform_transactions_basic(csv_processor, sample_rules):
@@ -88,3 +89,187 @@ def test_transform_transactions_different_date_format(csv_processor, sample_rule
   assert "2024/07/19 Honorable Expense" in output[0]
   assert "Expenses:AU" in output[0]
   assert "Assets:AU:Savings:HSBC" in output[0]
+
+
+def test_match_rules_follows_rule_order(base_processor):
+  rules = [
+    {"transaction_type": "realty", "debit_account": "A", "credit_account": "B"},
+    {"transaction_type": "*rent*", "debit_account": "C", "credit_account": "D"},
+  ]
+  descriptions = pd.Series(
+    ["TRANSFER RENT PAYMENT Wyndham Realty", "RENT PAID", "UNKNOWN TRANSACTION"]
+  )
+
+  rule_ids = base_processor.match_rules(descriptions, rules)
+
+  assert rule_ids.tolist() == [0, 1, -1]
+
+
+def test_match_rules_long_description_without_match(base_processor):
+  rules = [{"transaction_type": "*rent*", "debit_account": "A", "credit_account": "B"}]
+  descriptions = pd.Series(["A" * 50000])
+
+  rule_ids = base_processor.match_rules(descriptions, rules)
+
+  assert rule_ids.tolist() == [-1]
+
+
+def test_match_rules_literal_description_keeps_rule_order(base_processor):
+  rules = [
+    {"transaction_type": "*realty", "debit_account": "A", "credit_account": "B"},
+    {"transaction_type": "Wyndham Realty", "debit_account": "C", "credit_account": "D"},
+    {"transaction_type": "RENT PAID", "debit_account": "E", "credit_account": "F"},
+  ]
+  descriptions = pd.Series(["WYNDHAM REALTY", "rent paid", "RENT PAID TWICE"])
+
+  rule_ids = base_processor.match_rules(descriptions, rules)
+
+  assert rule_ids.tolist() == [0, 2, -1]
+
+
+def test_match_rules_categorical_descriptions(base_processor):
+  rules = [{"transaction_type": "*rent*", "debit_account": "A", "credit_account": "B"}]
+  descriptions = pd.Series(
+    pd.Categorical(["RENT PAID", None, "UNKNOWN TRANSACTION", "RENT PAID"])
+  )
+
+  rule_ids = base_processor.match_rules(descriptions, rules)
+
+  assert rule_ids.tolist() == [0, -1, -1, 0]
+
+
+def test_match_rules_repeated_and_missing_descriptions(base_processor):
+  rules = [{"transaction_type": "*rent*", "debit_account": "A", "credit_account": "B"}]
+  descriptions = pd.Series(["RENT PAID", None, "Rent Paid", "RENT PAID"])
+
+  rule_ids = base_processor.match_rules(descriptions, rules)
+
+  assert rule_ids.tolist() == [0, -1, 0, 0]
+
+
+def test_match_rules_agrees_with_match_rule(base_processor):
+  rules = [
+    {"transaction_type": glob, "debit_account": "A", "credit_account": "B"}
+    for glob in ["rent pai?", "[ij]nterest", "Wyndham Realty", "*salary", "atm*"]
+  ]
+  descriptions = [
+    "RENT PAID",
+    "rent paid twice",
+    "INTEREST",
+    "Jnterest earned",
+    "TRANSFER RENT PAYMENT Wyndham Realty",
+    "MONTHLY SALARY",
+    "SALARY ADVANCE",
+    "ATM WITHDRAWAL",
+    "PAID AT ATM",
+    "UNKNOWN TRANSACTION",
+  ]
+
+  rule_ids = base_processor.match_rules(pd.Series(descriptions), rules)
+
+  expected = []
+  for description in descriptions:
+    rule = base_processor.match_rule(description, rules)
+    expected.append(-1 if rule is None else rules.index(rule))
+  assert rule_ids.tolist() == expected
+
+
+def test_transform_transactions_missing_date(csv_processor, sample_rules):
+  data = {
+    "Transaction Date": ["2024-07-19", None],
+    "Description": ["RENT PAID", "RENT PAID"],
+    "Amount": ["-1,000.00", "-5.00"],
+  }
+  transactions_df = pd.DataFrame(data)
+
+  with pytest.raises(TypeError):  # Expecting a TypeError due to the missing date
+    csv_processor.transform_transactions(
+      transactions_df, sample_rules, csv_processor.headers
+    )
+
+
+def test_transform_transactions_empty_date(csv_processor, sample_rules):
+  data = {
+    "Transaction Date": ["2024-07-19", ""],
+    "Description": ["RENT PAID", "RENT PAID"],
+    "Amount": ["-1,000.00", "-5.00"],
+  }
+  transactions_df = pd.DataFrame(data)
+
+  with pytest.raises(TypeError):  # Expecting a TypeError due to the empty date
+    csv_processor.transform_transactions(
+      transactions_df, sample_rules, csv_processor.headers
+    )
+
+
+def test_transform_transactions_dates_with_offsets(csv_processor, sample_rules):
+  data = {
+    "Transaction Date": ["2024-03-01T00:00:00+02:00", "2024-03-02T23:30:00+02:00"],
+    "Description": ["RENT PAID", "RENT PAID"],
+    "Amount": ["-1,000.00", "-5.00"],
+  }
+  transactions_df = pd.DataFrame(data)
+
+  output = csv_processor.transform_transactions(
+    transactions_df, sample_rules, csv_processor.headers
+  )
+
+  assert output[0].startswith("2024/03/01 Rent Paid")
+  assert output[1].startswith("2024/03/02 Rent Paid")
+
+
+def test_transform_transactions_mixed_dates_with_offsets(csv_processor, sample_rules):
+  data = {
+    "Transaction Date": ["2024-03-01", "2024-03-02T23:30:00+02:00"],
+    "Description": ["RENT PAID", "RENT PAID"],
+    "Amount": ["-1,000.00", "-5.00"],
+  }
+  transactions_df = pd.DataFrame(data)
+
+  output = csv_processor.transform_transactions(
+    transactions_df, sample_rules, csv_processor.headers
+  )
+
+  assert output[0].startswith("2024/03/01 Rent Paid")
+  assert output[1].startswith("2024/03/02 Rent Paid")
+
+
+def test_transform_transactions_dates_with_several_offsets(csv_processor, sample_rules):
+  data = {
+    "Transaction Date": [
+      "19 Jul 2024",
+      "2024-03-02T23:30:00+02:00",
+      "2024-04-08T09:00:00+10:00",
+    ],
+    "Description": ["RENT PAID", "RENT PAID", "RENT PAID"],
+    "Amount": ["-1,000.00", "-5.00", "-7.00"],
+  }
+  transactions_df = pd.DataFrame(data)
+
+  output = csv_processor.transform_transactions(
+    transactions_df, sample_rules, csv_processor.headers
+  )
+
+  assert [line.split(" ")[0] for line in output] == [
+    "2024/07/19",
+    "2024/03/02",
+    "2024/04/08",
+  ]
+
+
+def test_transform_transactions_dates_across_daylight_saving(
+  csv_processor, sample_rules
+):
+  data = {
+    "Transaction Date": ["2024-03-30T09:00:00+11:00", "2024-04-08T09:00:00+10:00"],
+    "Description": ["RENT PAID", "RENT PAID"],
+    "Amount": ["-1,000.00", "-5.00"],
+  }
+  transactions_df = pd.DataFrame(data)
+
+  output = csv_processor.transform_transactions(
+    transactions_df, sample_rules, csv_processor.headers
+  )
+
+  assert output[0].startswith("2024/03/30 Rent Paid")
+  assert output[1].startswith("2024/04/08 Rent Paid")
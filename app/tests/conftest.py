@@ -1,12 +1,11 @@
 import pandas as pd
 import pytest
-import tempfile
-import os
 import yaml
 from pathlib import Path
+from types import SimpleNamespace
 from typer.testing import CliRunner
 from abc import ABC
-from common.base_processor import BaseProcessor, DEFAULT_HEADERS
+from common.base_processor import BaseProcessor, DEFAULT_HEADERS, YAML_LOADER
 from common.csv_processor import CsvProcessor
 
 SAMPLE_CSV = """
@@ -40,12 +39,12 @@ class TestBaseProcessor(BaseProcessor, ABC):
     return pd.DataFrame()  # Return an empty DataFrame for tests
 
   def get_header(self, rules) -> dict:
-    return DEFAULT_HEADERS  # Use default headers for tests
+    return {**DEFAULT_HEADERS}  # Use a copy of the default headers for tests
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_processor():
-  """Fixture to create a BaseProcessor instance."""
+  """Fixture to create a BaseProcessor instance shared across the test session."""
   return TestBaseProcessor()
 
 
@@ -59,55 +58,42 @@ def sample_transactions():
   return pd.DataFrame(data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rules():
-  return yaml.safe_load(SAMPLE_RULES)
+  """Parsed SAMPLE_RULES, shared read-only across the test session."""
+  return yaml.load(SAMPLE_RULES, Loader=YAML_LOADER)
 
 
-@pytest.fixture
-def sample_csv_file():
-  """Create temporary csv file for testing."""
-  csv_file = tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".csv")
+@pytest.fixture(scope="session")
+def sample_csv_file(tmp_path_factory):
+  """Create csv file for testing, written once per session."""
+  csv_path = tmp_path_factory.mktemp("data") / "sample.csv"
+  csv_path.write_text(SAMPLE_CSV.strip())
+  return SimpleNamespace(name=str(csv_path))
 
-  # Write to temporary CSV file
-  with open(csv_file.name, "w") as f:
-    f.write(SAMPLE_CSV.strip())
 
-  yield csv_file
-  # Cleanup files after test
-  os.remove(csv_file.name)
+@pytest.fixture(scope="session")
+def sample_rules_file(tmp_path_factory):
+  """Create rules file for testing, written once per session."""
+  rules_path = tmp_path_factory.mktemp("data") / "sample.yaml"
+  rules_path.write_text(SAMPLE_RULES.strip())
+  return SimpleNamespace(name=str(rules_path))
 
 
 @pytest.fixture
-def sample_rules_file(sample_rules):
-  """Create temporary rules file for testing."""
-  rules_file = tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".yaml")
+def sample_output_file(tmp_path):
+  """Create empty output file for testing."""
+  output_path = tmp_path / "output.txt"
+  output_path.touch()
+  return SimpleNamespace(name=str(output_path))
 
-  # Write to temporary CSV file
-  with open(rules_file.name, "w") as f:
-    f.write(SAMPLE_RULES.strip())
 
-  yield rules_file
-  # Cleanup files after test
-  os.remove(rules_file.name)
-
-
-@pytest.fixture
-def sample_output_file():
-  """Create temporary output file for testing."""
-  output_file = tempfile.NamedTemporaryFile(mode="w+", delete=False, suffix=".txt")
-
-  yield output_file
-  # Cleanup files after test
-  os.remove(output_file.name)
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def csv_processor(sample_rules_file, sample_csv_file):
-  """Fixture to create a CsvProcessor instance."""
+  """Fixture to create a CsvProcessor instance shared by the tests of a module."""
   return CsvProcessor(sample_rules_file.name, sample_csv_file.name)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
   return CliRunner()
@@ -1,3 +1,4 @@
+import io
 import pandas as pd
 import pytest
 from pandas.errors import EmptyDataError
@@ -18,3 +19,44 @@ def test_load_non_existent_file(csv_processor):
 def test_load_empty_csv(csv_processor, sample_output_file):
   with pytest.raises(EmptyDataError):
     csv_processor.load_input_file(sample_output_file.name)
+
+
+def test_load_csv_buffer(csv_processor):
+  buffer = io.StringIO(
+    "Transaction Date,Description,Amount\n19 Jul 2024,RENT PAID,1.00\n"
+  )
+
+  transactions = csv_processor.load_input_file(buffer)
+
+  assert transactions["Description"].tolist() == ["RENT PAID"]
+
+
+def test_load_valid_csv_pyarrow(csv_processor, tmp_path, monkeypatch):
+  pytest.importorskip("pyarrow")
+  input_file_path = tmp_path / "transactions.csv"
+  input_file_path.write_text(
+    'Transaction Date,Description,Amount\n19 Jul 2024,RENT PAID,"1,701.80"\n'
+  )
+  expected = csv_processor.load_input_file(input_file_path)
+  monkeypatch.setattr("common.csv_processor.CSV_ENGINE", "pyarrow")
+
+  transactions = csv_processor.load_input_file(input_file_path)
+
+  assert transactions.equals(expected)
+
+
+def test_load_empty_csv_pyarrow(csv_processor, sample_output_file, monkeypatch):
+  pytest.importorskip("pyarrow")
+  monkeypatch.setattr("common.csv_processor.CSV_ENGINE", "pyarrow")
+
+  with pytest.raises(EmptyDataError):
+    csv_processor.load_input_file(sample_output_file.name)
+
+
+def test_load_csv_memory_mapped(csv_processor, sample_csv_file, monkeypatch):
+  expected = csv_processor.load_input_file(sample_csv_file.name)
+  monkeypatch.setattr("common.csv_processor.MEMORY_MAP_THRESHOLD", 0)
+
+  transactions = csv_processor.load_input_file(sample_csv_file.name)
+
+  assert transactions.equals(expected)
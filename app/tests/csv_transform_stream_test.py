@@ -0,0 +1,81 @@
+import pandas as pd
+import pickle
+from common.csv_processor import CsvProcessor
+
+
+def test_transform_stream_matches_transform(csv_processor, tmp_path):
+  input_file_path = tmp_path / "transactions.csv"
+  input_file_path.write_text(
+    "Transaction Date,Description,Amount\n"
+    '19 Jul 2024,TRANSFER RENT PAYMENT Wyndham Realty,"1,701.80"\n'
+    '20 Jul 2024,RENT PAID,"-1,000.00"\n'
+    "21 Jul 2024,UNKNOWN TRANSACTION,10.00\n"
+  )
+  transactions = csv_processor.normalize_transactions(
+    csv_processor.load_input_file(input_file_path), csv_processor.headers
+  )
+  expected = csv_processor.transform_transactions(
+    transactions, csv_processor.rules, csv_processor.headers
+  )
+
+  output = list(csv_processor.transform_stream(input_file_path, chunksize=2))
+
+  assert output == expected
+  assert len(output) == 2
+
+
+def test_transform_stream_with_workers_keeps_file_order(csv_processor, tmp_path):
+  input_file_path = tmp_path / "transactions.csv"
+  input_file_path.write_text(
+    "Transaction Date,Description,Amount\n"
+    + "".join(f'{day} Jul 2024,RENT PAID,"-{day},000.00"\n' for day in range(1, 11))
+  )
+
+  expected = list(csv_processor.transform_stream(input_file_path, chunksize=3))
+  output = list(csv_processor.transform_stream(input_file_path, chunksize=3, workers=2))
+
+  assert output == expected
+  assert len(output) == 10
+
+
+def test_transform_stream_without_input_file(
+  csv_processor, sample_rules_file, tmp_path
+):
+  input_file_path = tmp_path / "transactions.csv"
+  input_file_path.write_text(
+    'Transaction Date,Description,Amount\n20 Jul 2024,RENT PAID,"-1,000.00"\n'
+  )
+  processor = CsvProcessor(sample_rules_file.name)
+
+  output = list(processor.transform_stream(input_file_path))
+
+  assert processor.transactions is None
+  assert output == list(csv_processor.transform_stream(input_file_path))
+  assert len(output) == 1
+
+
+def test_transform_chunk_pickles_without_transactions(csv_processor):
+  # Workers receive transform_chunk by pickle, which must not carry the
+  # processor's loaded transactions
+  assert b"Wyndham" not in pickle.dumps(csv_processor.transform_chunk)
+
+
+def test_transform_chunk_without_instance(csv_processor):
+  chunk = pd.DataFrame(
+    {
+      "Transaction Date": ["20 Jul 2024"],
+      "Description": ["RENT PAID"],
+      "Amount": ["-1,000.00"],
+    }
+  )
+
+  expected = csv_processor.transform_chunk(
+    chunk.copy(), csv_processor.rules, csv_processor.headers
+  )
+
+  output = CsvProcessor.transform_chunk(
+    chunk, csv_processor.rules, csv_processor.headers
+  )
+
+  assert output == expected
+  assert len(output) == 1
@@ -1,6 +1,7 @@
 import pytest
 import tempfile
-from ledger import app
+from pathlib import Path
+from ledger import app, run_ledger
 
 
 def test_unsupported_file_format(runner, sample_rules_file, sample_output_file):
@@ -10,3 +11,24 @@ def test_unsupported_file_format(runner, sample_rules_file, sample_output_file):
     runner.invoke(
       app, unsupported_file.name, sample_rules_file.name, sample_output_file.name
     )
+
+
+def test_run_ledger_unsupported_file_format(sample_rules_file):
+  with pytest.raises(ValueError):
+    run_ledger(Path("transactions.txt"), Path(sample_rules_file.name))
+
+
+def test_run_ledger_csv(sample_rules_file, tmp_path):
+  input_file = tmp_path / "transactions.csv"
+  input_file.write_text(
+    "Transaction Date,Description,Amount\n"
+    '20 Jul 2024,RENT PAID,"-1,000.00"\n'
+    '19 Jul 2024,TRANSFER RENT PAYMENT Wyndham Realty,"1,701.80"\n'
+  )
+
+  ledger, output_path = run_ledger(input_file, Path(sample_rules_file.name))
+
+  assert output_path is None
+  assert ledger.index("2024/07/19 Transfer Rent Payment") < ledger.index(
+    "2024/07/20 Rent Paid"
+  )